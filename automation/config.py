@@ -26,6 +26,7 @@ class Settings:
     youtube_privacy_status: str = "private"
     youtube_client_secrets_file: Path = Path("credentials/client_secret.json")
     youtube_token_file: Path = Path("credentials/token.json")
+    youtube_api_endpoint: Optional[str] = None
     background_music_file: Optional[Path] = None
 
     def ensure_directories(self) -> None:
@@ -122,7 +122,9 @@ def run(
     youtube_client = None
     if not dry_run:
         youtube_client = uploader.get_authenticated_service(
-            settings.youtube_client_secrets_file, settings.youtube_token_file
+            settings.youtube_client_secrets_file,
+            settings.youtube_token_file,
+            api_endpoint=settings.youtube_api_endpoint,
         )
 
     video_paths: List[Path] = []
@@ -1,21 +1,123 @@
 """Upload finished videos to YouTube using the Data API."""
 from __future__ import annotations
 
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, Optional
+import json
+import logging
+import threading
 
+import httplib2
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient import discovery_cache
+from googleapiclient.discovery import build_from_document
 from googleapiclient.errors import HttpError
 from googleapiclient.http import MediaFileUpload
 from google_auth_oauthlib.flow import InstalledAppFlow
 
 SCOPES = ["https://www.googleapis.com/auth/youtube.upload"]
 
+_HTTP_TIMEOUT_SECONDS = 120
+_TOKEN_REFRESH_MARGIN = timedelta(minutes=5)
+_TOKEN_RETRY_SECONDS = 30.0
 
-def get_authenticated_service(client_secret_file: Path, token_file: Path):
-    """Authenticate against the YouTube Data API v3 and return a client."""
+
+@lru_cache(maxsize=None)
+def _load_discovery_document(service_name: str, version: str) -> str:
+    """Return the discovery document bundled with ``googleapiclient``.
+
+    The document ships with the client library, so reading it once per process
+    avoids fetching it over the network on every run.
+    """
+
+    document = discovery_cache.get_static_doc(service_name, version)
+    if document is None:
+        raise RuntimeError(f"No bundled discovery document for {service_name} {version}.")
+    return document
+
+
+def _save_credentials(creds: Credentials, token_file: Path) -> None:
+    """Persist ``creds`` to ``token_file`` so later runs skip the OAuth flow."""
+
+    token_file.parent.mkdir(parents=True, exist_ok=True)
+    with token_file.open("w", encoding="utf-8") as fp:
+        fp.write(creds.to_json())
+
+
+class TokenRefresher:
+    """Refresh OAuth credentials in a background thread before they expire.
+
+    The refresh happens ``margin`` ahead of the token expiry so uploads never
+    stall on a synchronous refresh. Refreshed tokens are written back to
+    ``token_file``.
+    """
+
+    def __init__(
+        self,
+        creds: Credentials,
+        token_file: Path,
+        margin: timedelta = _TOKEN_REFRESH_MARGIN,
+    ) -> None:
+        self._creds = creds
+        self._token_file = token_file
+        self._margin = margin
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="youtube-token-refresher", daemon=True
+        )
+
+    def start(self) -> "TokenRefresher":
+        """Start the background refresh thread."""
+
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Signal the refresh thread to exit and wait for it."""
+
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout)
+
+    def _seconds_until_refresh(self) -> Optional[float]:
+        expiry = self._creds.expiry
+        if expiry is None:
+            return None
+        # google-auth stores the expiry as a naive UTC datetime.
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        return max((expiry - self._margin - now).total_seconds(), 0.0)
+
+    def _run(self) -> None:
+        while True:
+            delay = self._seconds_until_refresh()
+            if delay is None or self._stop.wait(delay):
+                return
+            try:
+                self._creds.refresh(Request())
+                _save_credentials(self._creds, self._token_file)
+            except Exception as exc:  # pragma: no cover - network dependent
+                logging.warning("Background YouTube token refresh failed: %s", exc)
+                if self._stop.wait(_TOKEN_RETRY_SECONDS):
+                    return
+
+
+def get_authenticated_service(
+    client_secret_file: Path,
+    token_file: Path,
+    api_endpoint: Optional[str] = None,
+):
+    """Authenticate against the YouTube Data API v3 and return a client.
+
+    The client is built from the bundled discovery document and shares a single
+    keep-alive HTTP connection pool across requests, so consecutive uploads do
+    not reconnect. A :class:`TokenRefresher` keeps the token fresh in the
+    background. ``api_endpoint`` overrides the API root URL, which lets a local
+    stub server stand in for YouTube.
+    """
 
     creds: Optional[Credentials] = None
     if token_file.exists():
@@ -27,11 +129,21 @@ def get_authenticated_service(client_secret_file: Path, token_file: Path):
         else:
             flow = InstalledAppFlow.from_client_secrets_file(str(client_secret_file), SCOPES)
             creds = flow.run_console()
-        token_file.parent.mkdir(parents=True, exist_ok=True)
-        with token_file.open("w", encoding="utf-8") as fp:
-            fp.write(creds.to_json())
+        _save_credentials(creds, token_file)
+
+    if creds.refresh_token:
+        TokenRefresher(creds, token_file).start()
+
+    document = json.loads(_load_discovery_document("youtube", "v3"))
+    if api_endpoint:
+        # Rewrite the root rather than using ``client_options`` so media uploads,
+        # which are addressed from ``rootUrl``, also honour the URL scheme.
+        root_url = api_endpoint.rstrip("/") + "/"
+        document["rootUrl"] = root_url
+        document["mtlsRootUrl"] = root_url
 
-    return build("youtube", "v3", credentials=creds)
+    http = AuthorizedHttp(creds, http=httplib2.Http(timeout=_HTTP_TIMEOUT_SECONDS))
+    return build_from_document(document, http=http)
 
 
 def upload_video(